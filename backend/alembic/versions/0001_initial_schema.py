@@ -0,0 +1,99 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("nome", sa.String(100), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("celular", sa.String(20), nullable=True),
+        sa.Column("senha_hash", sa.String(255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("valor_total", sa.Numeric(12, 2), nullable=False),
+        sa.Column("descricao", sa.String(255), nullable=False),
+        sa.Column("categoria", sa.String(50), nullable=False),
+        sa.Column(
+            "tipo",
+            sa.Enum("ENTRADA", "SAIDA_DEBITO", "SAIDA_CREDITO", name="transactiontype"),
+            nullable=False
+        ),
+        sa.Column("data_compra", sa.Date(), nullable=False),
+        sa.Column("num_parcelas", sa.Integer(), nullable=True),
+        sa.Column("notas", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_transactions_id", "transactions", ["id"])
+    op.create_index("ix_transactions_user_id", "transactions", ["user_id"])
+
+    op.create_table(
+        "installments",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "transacao_id", sa.Integer(), sa.ForeignKey("transactions.id", ondelete="CASCADE"), nullable=False
+        ),
+        sa.Column("numero_parcela", sa.Integer(), nullable=False),
+        sa.Column("total_parcelas", sa.Integer(), nullable=False),
+        sa.Column("valor_parcela", sa.Numeric(12, 2), nullable=False),
+        sa.Column("data_vencimento", sa.Date(), nullable=False),
+        sa.Column(
+            "status_pagamento",
+            sa.Enum("PENDENTE", "PAGO", "ATRASADO", name="paymentstatus"),
+            nullable=False
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_installments_id", "installments", ["id"])
+    op.create_index("ix_installments_transacao_id", "installments", ["transacao_id"])
+    op.create_index("ix_installments_data_vencimento", "installments", ["data_vencimento"])
+
+    op.create_table(
+        "savings_goals",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("nome_objetivo", sa.String(100), nullable=False),
+        sa.Column("descricao", sa.Text(), nullable=True),
+        sa.Column("valor_meta", sa.Numeric(12, 2), nullable=False),
+        sa.Column("valor_atual", sa.Numeric(12, 2), nullable=True),
+        sa.Column("data_limite", sa.Date(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_savings_goals_id", "savings_goals", ["id"])
+    op.create_index("ix_savings_goals_user_id", "savings_goals", ["user_id"])
+
+
+def downgrade():
+    op.drop_table("savings_goals")
+    op.drop_table("installments")
+    op.drop_table("transactions")
+    op.drop_table("users")
+    sa.Enum(name="paymentstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="transactiontype").drop(op.get_bind(), checkfirst=True)
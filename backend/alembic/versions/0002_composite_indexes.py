@@ -0,0 +1,32 @@
+"""Composite indexes for per-user date and status lookups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_transactions_user_id_data_compra", "transactions", ["user_id", "data_compra"])
+    op.create_index(
+        "ix_transactions_user_id_tipo_data_compra", "transactions", ["user_id", "tipo", "data_compra"]
+    )
+    op.create_index(
+        "ix_installments_transacao_id_data_vencimento", "installments", ["transacao_id", "data_vencimento"]
+    )
+    op.create_index("ix_savings_goals_user_id_is_active", "savings_goals", ["user_id", "is_active"])
+
+
+def downgrade():
+    op.drop_index("ix_savings_goals_user_id_is_active", table_name="savings_goals")
+    op.drop_index("ix_installments_transacao_id_data_vencimento", table_name="installments")
+    op.drop_index("ix_transactions_user_id_tipo_data_compra", table_name="transactions")
+    op.drop_index("ix_transactions_user_id_data_compra", table_name="transactions")
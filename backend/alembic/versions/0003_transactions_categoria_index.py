@@ -0,0 +1,22 @@
+"""Index transactions by user and category
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_transactions_user_id_categoria", "transactions", ["user_id", "categoria"])
+
+
+def downgrade():
+    op.drop_index("ix_transactions_user_id_categoria", table_name="transactions")
@@ -0,0 +1,30 @@
+"""Partial index on pending installments
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Enum columns store member names, hence 'PENDENTE'
+    op.create_index(
+        "ix_installments_pending",
+        "installments",
+        ["transacao_id"],
+        postgresql_where=sa.text("status_pagamento = 'PENDENTE'"),
+        sqlite_where=sa.text("status_pagamento = 'PENDENTE'")
+    )
+
+
+def downgrade():
+    op.drop_index("ix_installments_pending", table_name="installments")
@@ -0,0 +1,189 @@
+"""
+Redis Cache for FinanceApp
+Optional read-through cache for per-user dashboard aggregates, the
+authenticated user lookup and the category list.
+
+Caching is enabled only when REDIS_URL is set. Redis failures are
+swallowed so an outage never breaks a request; callers simply fall
+back to the database. After a failure, reads and writes skip Redis for
+REDIS_DOWN_COOLDOWN seconds instead of waiting on the socket timeout
+each time. Invalidations are always attempted so no stale entry
+survives a write.
+"""
+
+import json
+import logging
+import os
+import time
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Redis URL - e.g. redis://localhost:6379/0. Caching is disabled if unset.
+REDIS_URL = os.getenv("REDIS_URL")
+DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", "60"))  # Seconds
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "45"))  # Seconds
+CATEGORIES_CACHE_TTL = int(os.getenv("CATEGORIES_CACHE_TTL", "3600"))  # Seconds
+
+redis_client = None
+if REDIS_URL:
+    redis_client = redis.Redis.from_url(
+        REDIS_URL,
+        socket_timeout=0.5,
+        socket_connect_timeout=0.5
+    )
+
+# After a Redis error, reads and writes are skipped until this monotonic
+# time, so an outage doesn't add a socket timeout to every cache call
+REDIS_DOWN_COOLDOWN = float(os.getenv("REDIS_DOWN_COOLDOWN", "5"))  # Seconds
+_redis_down_until = 0.0
+
+
+def _redis_available() -> bool:
+    """Whether cache reads and writes should go to Redis right now."""
+    return redis_client is not None and time.monotonic() >= _redis_down_until
+
+
+def _mark_redis_down(error: Exception) -> None:
+    """Log a Redis error and start the cooldown."""
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_DOWN_COOLDOWN
+    logger.warning("Redis unavailable, skipping cache for %.0fs: %s", REDIS_DOWN_COOLDOWN, error)
+
+
+def _dashboard_key(user_id: int) -> str:
+    """All dashboard entries of a user live in one hash, so one DEL clears them."""
+    return f"dash:{user_id}"
+
+
+def get_dashboard_cache(user_id: int, name: str):
+    """
+    Get a cached dashboard payload.
+
+    Args:
+        user_id: Owner of the cached data
+        name: Entry name, e.g. "summary:1:2024"
+
+    Returns:
+        The decoded JSON payload, or None on a miss or Redis error
+    """
+    if not _redis_available():
+        return None
+    try:
+        cached = redis_client.hget(_dashboard_key(user_id), name)
+    except redis.RedisError as e:
+        _mark_redis_down(e)
+        return None
+    return json.loads(cached) if cached is not None else None
+
+
+def set_dashboard_cache(user_id: int, name: str, payload) -> None:
+    """
+    Store a JSON-serializable dashboard payload for DASHBOARD_CACHE_TTL seconds.
+    """
+    if not _redis_available():
+        return
+    key = _dashboard_key(user_id)
+    try:
+        pipe = redis_client.pipeline()
+        pipe.hset(key, name, json.dumps(payload, default=str))
+        pipe.expire(key, DASHBOARD_CACHE_TTL)
+        pipe.execute()
+    except redis.RedisError as e:
+        _mark_redis_down(e)
+
+
+def invalidate_dashboard_cache(user_id: int) -> None:
+    """
+    Drop every cached dashboard entry of a user.
+    Call this after any write that changes transactions or savings goals.
+    """
+    if redis_client is None:
+        return
+    try:
+        redis_client.unlink(_dashboard_key(user_id))
+    except redis.RedisError as e:
+        _mark_redis_down(e)
+
+
+def _user_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def get_cached_user(user_id: int):
+    """
+    Get the cached profile fields of a user.
+
+    Returns:
+        Dict of user fields, or None on a miss or Redis error
+    """
+    if not _redis_available():
+        return None
+    try:
+        cached = redis_client.get(_user_key(user_id))
+    except redis.RedisError as e:
+        _mark_redis_down(e)
+        return None
+    return json.loads(cached) if cached is not None else None
+
+
+def set_cached_user(user_id: int, fields: dict) -> None:
+    """Store the profile fields of a user for USER_CACHE_TTL seconds."""
+    if not _redis_available():
+        return
+    try:
+        redis_client.setex(_user_key(user_id), USER_CACHE_TTL, json.dumps(fields, default=str))
+    except redis.RedisError as e:
+        _mark_redis_down(e)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop the cached profile of a user. Call this after profile updates."""
+    if redis_client is None:
+        return
+    try:
+        redis_client.unlink(_user_key(user_id))
+    except redis.RedisError as e:
+        _mark_redis_down(e)
+
+
+def _categories_key(user_id: int) -> str:
+    return f"cats:{user_id}"
+
+
+def get_cached_categories(user_id: int):
+    """
+    Get the cached category list of a user.
+
+    Returns:
+        List of category names, or None on a miss or Redis error
+    """
+    if not _redis_available():
+        return None
+    try:
+        cached = redis_client.get(_categories_key(user_id))
+    except redis.RedisError as e:
+        _mark_redis_down(e)
+        return None
+    return json.loads(cached) if cached is not None else None
+
+
+def set_cached_categories(user_id: int, categories: list) -> None:
+    """Store the category list of a user for CATEGORIES_CACHE_TTL seconds."""
+    if not _redis_available():
+        return
+    try:
+        redis_client.setex(_categories_key(user_id), CATEGORIES_CACHE_TTL, json.dumps(categories))
+    except redis.RedisError as e:
+        _mark_redis_down(e)
+
+
+def invalidate_cached_categories(user_id: int) -> None:
+    """Drop the cached category list of a user. Call this after transaction writes."""
+    if redis_client is None:
+        return
+    try:
+        redis_client.unlink(_categories_key(user_id))
+    except redis.RedisError as e:
+        _mark_redis_down(e)
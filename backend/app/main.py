@@ -15,8 +15,12 @@ from .routers import auth, transactions, savings, dashboard
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
-    init_db()
+    """
+    Optionally create the schema on startup (local development only).
+    Deployments run `alembic upgrade head` once instead of every worker.
+    """
+    if os.getenv("AUTO_CREATE_SCHEMA") == "1":
+        init_db()
     yield
 
 
@@ -45,8 +49,8 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 # Include routers
@@ -0,0 +1,57 @@
+"""
+Database Migrations Entry Point for FinanceApp
+Runs `alembic upgrade head` at container start-up.
+
+Databases created by create_all() (the old start-up path, or init_db with
+AUTO_CREATE_SCHEMA=1) have no alembic_version table. They are stamped at
+the newest revision whose objects they already contain, so the upgrade
+only applies what is actually missing.
+
+Usage:
+    python -m app.migrate
+"""
+
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from .database import engine
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+INITIAL_REVISION = "0001"
+
+# Newest first: (revision, table, index that revision creates)
+REVISION_MARKERS = (
+    ("0004", "installments", "ix_installments_pending"),
+    ("0003", "transactions", "ix_transactions_user_id_categoria"),
+    ("0002", "transactions", "ix_transactions_user_id_data_compra"),
+)
+
+
+def detect_revision(inspector) -> str:
+    """Find the newest revision already applied to an unversioned schema."""
+    for revision, table, index in REVISION_MARKERS:
+        if index in {ix["name"] for ix in inspector.get_indexes(table)}:
+            return revision
+    return INITIAL_REVISION
+
+
+def upgrade_database() -> None:
+    """Bring the database schema to the latest revision."""
+    config = Config(ALEMBIC_INI)
+    # script_location in alembic.ini is relative; resolve it next to the ini file
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "alembic"))
+
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+    if "users" in tables and "alembic_version" not in tables:
+        # Schema built by create_all() rather than by migrations
+        command.stamp(config, detect_revision(inspector))
+
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    upgrade_database()
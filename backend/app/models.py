@@ -11,11 +11,13 @@ Models:
 
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean, Date, DateTime,
-    Numeric, Enum, ForeignKey
+    Numeric, Enum, ForeignKey, Index, case, text
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
+from decimal import Decimal
 import enum
 
 
@@ -106,6 +108,11 @@ class Transaction(Base):
         notas: Additional notes
     """
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_user_id_data_compra", "user_id", "data_compra"),
+        Index("ix_transactions_user_id_tipo_data_compra", "user_id", "tipo", "data_compra"),
+        Index("ix_transactions_user_id_categoria", "user_id", "categoria"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
@@ -162,6 +169,17 @@ class Installment(Base):
         status_pagamento: Payment status (pendente, pago, atrasado)
     """
     __tablename__ = "installments"
+    __table_args__ = (
+        Index("ix_installments_transacao_id_data_vencimento", "transacao_id", "data_vencimento"),
+        # Partial index for the "has pending installments" EXISTS probe.
+        # Enum columns store member names, hence 'PENDENTE'.
+        Index(
+            "ix_installments_pending",
+            "transacao_id",
+            postgresql_where=text("status_pagamento = 'PENDENTE'"),
+            sqlite_where=text("status_pagamento = 'PENDENTE'")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     transacao_id = Column(
@@ -215,6 +233,9 @@ class SavingsGoal(Base):
         is_active: Whether the goal is still active
     """
     __tablename__ = "savings_goals"
+    __table_args__ = (
+        Index("ix_savings_goals_user_id_is_active", "user_id", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
@@ -226,7 +247,7 @@ class SavingsGoal(Base):
     nome_objetivo = Column(String(100), nullable=False)
     descricao = Column(Text, nullable=True)
     valor_meta = Column(Numeric(12, 2), nullable=False)
-    valor_atual = Column(Numeric(12, 2), default=0)
+    valor_atual = Column(Numeric(12, 2), default=Decimal("0.00"))
     data_limite = Column(Date, nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -235,22 +256,39 @@ class SavingsGoal(Base):
     # Relationships
     user = relationship("User", back_populates="savings_goals")
 
-    @property
+    @hybrid_property
     def progress_percentage(self) -> float:
         """
         Calculate progress towards the goal.
-        Returns percentage as a float (0.0 to 100.0).
+        Returns percentage as a float (0.0 to 100.0), rounded to 2 places.
+        Usable in queries as a SQL expression as well.
         """
         if self.valor_meta and self.valor_meta > 0:
             progress = (float(self.valor_atual) / float(self.valor_meta)) * 100
-            return min(progress, 100.0)  # Cap at 100%
+            return round(min(progress, 100.0), 2)  # Cap at 100%
         return 0.0
 
-    @property
-    def valor_restante(self) -> float:
+    @progress_percentage.expression
+    def progress_percentage(cls):
+        return case(
+            (cls.valor_meta <= 0, 0.0),
+            (cls.valor_atual >= cls.valor_meta, 100.0),  # Cap at 100%
+            # Rounded like the Python path so both return the same value
+            else_=func.round(cls.valor_atual * 100.0 / cls.valor_meta, 2)
+        )
+
+    @hybrid_property
+    def valor_restante(self) -> Decimal:
         """Calculate remaining amount to reach the goal."""
-        remaining = float(self.valor_meta) - float(self.valor_atual)
-        return max(remaining, 0.0)
+        remaining = self.valor_meta - self.valor_atual
+        return max(remaining, Decimal("0"))
+
+    @valor_restante.expression
+    def valor_restante(cls):
+        return case(
+            (cls.valor_meta > cls.valor_atual, cls.valor_meta - cls.valor_atual),
+            else_=0
+        )
 
     def __repr__(self):
         return f"<SavingsGoal(id={self.id}, nome='{self.nome_objetivo}', progress={self.progress_percentage:.1f}%)>"
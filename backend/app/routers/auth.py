@@ -5,13 +5,20 @@ Endpoints:
 - POST /register - Create new user account
 - POST /login - Authenticate and get JWT token
 - GET /me - Get current user profile
+
+Handlers that use the (synchronous) database session are declared with
+plain `def`, so FastAPI runs them in its threadpool instead of blocking
+the event loop.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
-from datetime import timedelta
+from datetime import datetime, timedelta
 
+from ..cache import get_cached_user, set_cached_user, invalidate_cached_user
 from ..database import get_db
 from ..models import User
 from ..schemas import (
@@ -22,6 +29,8 @@ from ..utils import (
     decode_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 # OAuth2 scheme for token authentication
@@ -32,37 +41,74 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 # DEPENDENCIES
 # ============================================
 
-async def get_current_user(
+def _user_to_cache(user: User) -> dict:
+    """Profile fields kept in the user cache (never the password hash)."""
+    return {
+        "id": user.id,
+        "nome": user.nome,
+        "email": user.email,
+        "celular": user.celular,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat() if user.created_at else None
+    }
+
+
+def _user_from_cache(fields: dict) -> User:
+    """Rebuild a detached User from cached profile fields."""
+    created_at = fields["created_at"]
+    return User(
+        id=fields["id"],
+        nome=fields["nome"],
+        email=fields["email"],
+        celular=fields["celular"],
+        is_active=fields["is_active"],
+        created_at=datetime.fromisoformat(created_at) if created_at else None
+    )
+
+
+def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
     """
     Dependency to get the current authenticated user from JWT token.
+    
+    The user is cached on request.state, so nested dependencies in the
+    same request don't decode the token or query the database again.
     """
+    cached_user = getattr(request.state, "user", None)
+    if cached_user is not None:
+        return cached_user
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Credenciais inválidas",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    print(f"[DEBUG] Token received: {token[:50]}..." if token else "[DEBUG] No token")
-    
     try:
         payload = decode_access_token(token)
-        print(f"[DEBUG] Payload decoded: {payload}")
         user_id_str = payload.get("sub")
         if user_id_str is None:
-            print("[DEBUG] No 'sub' in payload")
+            logger.debug("No 'sub' in token payload")
             raise credentials_exception
         user_id = int(user_id_str)  # Convert string back to int
     except Exception as e:
-        print(f"[DEBUG] Token decode error: {e}")
+        logger.debug("Token decode error: %s", e)
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        print(f"[DEBUG] User not found with id: {user_id}")
-        raise credentials_exception
+    cached_fields = get_cached_user(user_id)
+    if cached_fields is not None:
+        # Detached User with profile fields only; endpoints that modify the
+        # user must load it from the session first
+        user = _user_from_cache(cached_fields)
+    else:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None:
+            logger.debug("User not found with id: %s", user_id)
+            raise credentials_exception
+        set_cached_user(user_id, _user_to_cache(user))
     
     if not user.is_active:
         raise HTTPException(
@@ -70,7 +116,9 @@ async def get_current_user(
             detail="Usuário inativo"
         )
     
-    print(f"[DEBUG] User authenticated: {user.email}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("User authenticated: %s", user.email)
+    request.state.user = user
     return user
 
 
@@ -79,7 +127,7 @@ async def get_current_user(
 # ============================================
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """
     Register a new user account.
     
@@ -89,9 +137,9 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     - **senha**: Password (min 6 characters)
     - **confirmar_senha**: Password confirmation
     """
-    # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
+    # Check if email already exists (EXISTS avoids loading the User row)
+    email_taken = db.query(exists().where(User.email == user_data.email)).scalar()
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email já cadastrado"
@@ -107,18 +155,17 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     
     return new_user
 
 
 @router.post("/login", response_model=Token)
-async def login(
+def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
     """
-    Authenticate user and return JWT token.
+    Authenticate user and return JWT token along with the user's profile.
     
     Uses OAuth2 password flow:
     - **username**: Email address
@@ -146,7 +193,11 @@ async def login(
         expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     
-    return Token(access_token=access_token, token_type="bearer")
+    return Token(
+        access_token=access_token,
+        token_type="bearer",
+        user=UserRead.model_validate(user)
+    )
 
 
 @router.get("/me", response_model=UserRead)
@@ -158,7 +209,7 @@ async def get_me(current_user: User = Depends(get_current_user)):
 
 
 @router.put("/me", response_model=UserRead)
-async def update_me(
+def update_me(
     user_data: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -169,12 +220,16 @@ async def update_me(
     - **nome**: Update name (optional)
     - **celular**: Update phone (optional)
     """
+    # current_user may come from the cache, so update the session's copy
+    user = db.get(User, current_user.id)
+    
     if user_data.nome is not None:
-        current_user.nome = user_data.nome
+        user.nome = user_data.nome
     if user_data.celular is not None:
-        current_user.celular = user_data.celular
+        user.celular = user_data.celular
     
     db.commit()
-    db.refresh(current_user)
+    invalidate_cached_user(user.id)
+    db.refresh(user)
     
-    return current_user
+    return user
@@ -8,21 +8,26 @@ Endpoints:
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import extract, func
+from sqlalchemy import Numeric, case, cast, exists, func, select, union_all
 from typing import List
 from decimal import Decimal
 from datetime import date
 
+from ..cache import get_dashboard_cache, set_dashboard_cache
 from ..database import get_db
 from ..models import Transaction, Installment, SavingsGoal, User, TransactionType, PaymentStatus
 from ..schemas import DashboardSummary, DashboardCategorySummary, CategorySummary
+from ..utils import get_intervalo_mes
 from .auth import get_current_user
 
 router = APIRouter()
 
+# Typed zero so COALESCE(SUM(...)) always comes back as a Decimal
+ZERO_AMOUNT = cast(0, Numeric(12, 2))
+
 
 @router.get("/summary", response_model=DashboardSummary)
-async def get_dashboard_summary(
+def get_dashboard_summary(
     mes: int = Query(..., ge=1, le=12, description="Mês (1-12)"),
     ano: int = Query(..., ge=2000, description="Ano"),
     current_user: User = Depends(get_current_user),
@@ -37,56 +42,81 @@ async def get_dashboard_summary(
     - **total_guardado**: Sum of all SavingsGoal current values
     - **saldo_disponivel**: total_entradas - total_saidas
     """
+    cache_name = f"summary:{mes}:{ano}"
+    cached = get_dashboard_cache(current_user.id, cache_name)
+    if cached is not None:
+        return cached
     
-    # Calculate total income (entradas) for the month
-    total_entradas = db.query(func.coalesce(func.sum(Transaction.valor_total), 0)).filter(
-        Transaction.user_id == current_user.id,
-        Transaction.tipo == TransactionType.ENTRADA,
-        extract('month', Transaction.data_compra) == mes,
-        extract('year', Transaction.data_compra) == ano
-    ).scalar()
+    inicio, fim = get_intervalo_mes(mes, ano)
     
-    # Calculate debit expenses for the month
-    total_debito = db.query(func.coalesce(func.sum(Transaction.valor_total), 0)).filter(
+    # Income and debit expenses for the month via conditional aggregation
+    transaction_totals = select(
+        func.coalesce(func.sum(case(
+            (Transaction.tipo == TransactionType.ENTRADA, Transaction.valor_total),
+            else_=0
+        )), ZERO_AMOUNT).label('entradas'),
+        func.coalesce(func.sum(case(
+            (Transaction.tipo == TransactionType.SAIDA_DEBITO, Transaction.valor_total),
+            else_=0
+        )), ZERO_AMOUNT).label('debito')
+    ).where(
         Transaction.user_id == current_user.id,
-        Transaction.tipo == TransactionType.SAIDA_DEBITO,
-        extract('month', Transaction.data_compra) == mes,
-        extract('year', Transaction.data_compra) == ano
-    ).scalar()
+        Transaction.data_compra >= inicio,
+        Transaction.data_compra < fim
+    ).subquery()
     
-    # Calculate credit installments due in the month
-    total_parcelas = db.query(func.coalesce(func.sum(Installment.valor_parcela), 0)).join(
-        Transaction
-    ).filter(
+    # Credit installments due in the month
+    installments_total = select(
+        func.coalesce(func.sum(Installment.valor_parcela), ZERO_AMOUNT)
+    ).join(Transaction).where(
         Transaction.user_id == current_user.id,
-        extract('month', Installment.data_vencimento) == mes,
-        extract('year', Installment.data_vencimento) == ano
-    ).scalar()
+        Installment.data_vencimento >= inicio,
+        Installment.data_vencimento < fim
+    ).scalar_subquery()
     
-    # Total expenses = debit + credit installments
-    total_saidas = Decimal(str(total_debito)) + Decimal(str(total_parcelas))
-    
-    # Calculate total saved in all savings goals
-    total_guardado = db.query(func.coalesce(func.sum(SavingsGoal.valor_atual), 0)).filter(
+    # Total saved in all active savings goals
+    savings_total = select(
+        func.coalesce(func.sum(SavingsGoal.valor_atual), ZERO_AMOUNT)
+    ).where(
         SavingsGoal.user_id == current_user.id,
         SavingsGoal.is_active == True
-    ).scalar()
+    ).scalar_subquery()
+    
+    # Fetch all aggregates in a single round-trip
+    total_entradas, total_debito, total_parcelas, total_guardado = db.query(
+        transaction_totals.c.entradas,
+        transaction_totals.c.debito,
+        installments_total.label('parcelas'),
+        savings_total.label('guardado')
+    ).one()
+    
+    # Total expenses = debit + credit installments (all values are Decimal)
+    total_saidas = total_debito + total_parcelas
     
     # Calculate available balance
-    saldo_disponivel = Decimal(str(total_entradas)) - total_saidas
+    saldo_disponivel = total_entradas - total_saidas
     
-    return DashboardSummary(
+    # Share of the income left after expenses
+    variacao_percentual = None
+    if total_entradas > 0:
+        variacao_percentual = round(float(saldo_disponivel / total_entradas * 100), 2)
+    
+    summary = DashboardSummary(
         mes=mes,
         ano=ano,
-        total_entradas=Decimal(str(total_entradas)),
+        total_entradas=total_entradas,
         total_saidas=total_saidas,
-        total_guardado=Decimal(str(total_guardado)),
-        saldo_disponivel=saldo_disponivel
+        total_guardado=total_guardado,
+        saldo_disponivel=saldo_disponivel,
+        variacao_percentual=variacao_percentual
     )
+    
+    set_dashboard_cache(current_user.id, cache_name, summary.model_dump(mode="json"))
+    return summary
 
 
 @router.get("/categories", response_model=DashboardCategorySummary)
-async def get_expenses_by_category(
+def get_expenses_by_category(
     mes: int = Query(..., ge=1, le=12),
     ano: int = Query(..., ge=2000),
     current_user: User = Depends(get_current_user),
@@ -98,60 +128,69 @@ async def get_expenses_by_category(
     Returns the distribution of expenses (debit + credit installments)
     across categories with percentage calculations.
     """
+    cache_name = f"categories:{mes}:{ano}"
+    cached = get_dashboard_cache(current_user.id, cache_name)
+    if cached is not None:
+        return cached
     
-    # Get debit expenses by category
-    debit_by_category = db.query(
-        Transaction.categoria,
-        func.sum(Transaction.valor_total).label('total')
-    ).filter(
+    inicio, fim = get_intervalo_mes(mes, ano)
+    
+    # Debit expenses of the month
+    debit_expenses = select(
+        Transaction.categoria.label('categoria'),
+        Transaction.valor_total.label('valor')
+    ).where(
         Transaction.user_id == current_user.id,
         Transaction.tipo == TransactionType.SAIDA_DEBITO,
-        extract('month', Transaction.data_compra) == mes,
-        extract('year', Transaction.data_compra) == ano
-    ).group_by(Transaction.categoria).all()
+        Transaction.data_compra >= inicio,
+        Transaction.data_compra < fim
+    )
     
-    # Get credit installments by category (through transaction)
-    credit_by_category = db.query(
+    # Credit installments due in the month (category from the transaction)
+    credit_expenses = select(
         Transaction.categoria,
-        func.sum(Installment.valor_parcela).label('total')
-    ).join(Installment).filter(
+        Installment.valor_parcela
+    ).select_from(Installment).join(Transaction).where(
         Transaction.user_id == current_user.id,
-        extract('month', Installment.data_vencimento) == mes,
-        extract('year', Installment.data_vencimento) == ano
-    ).group_by(Transaction.categoria).all()
-    
-    # Combine both into a dictionary
-    category_totals = {}
-    
-    for cat, total in debit_by_category:
-        category_totals[cat] = category_totals.get(cat, Decimal('0')) + Decimal(str(total))
+        Installment.data_vencimento >= inicio,
+        Installment.data_vencimento < fim
+    )
     
-    for cat, total in credit_by_category:
-        category_totals[cat] = category_totals.get(cat, Decimal('0')) + Decimal(str(total))
+    # Merge, group and sort in a single statement
+    expenses = union_all(debit_expenses, credit_expenses).subquery()
+    category_total = func.sum(expenses.c.valor)
+    category_totals = db.query(
+        expenses.c.categoria,
+        category_total.label('total')
+    ).group_by(expenses.c.categoria).order_by(category_total.desc()).all()
     
     # Calculate grand total
-    grand_total = sum(category_totals.values()) or Decimal('1')  # Avoid division by zero
+    grand_total = sum((total for _, total in category_totals), Decimal('0'))
+    divisor = float(grand_total) or 1.0  # Avoid division by zero
     
     # Build category summaries with percentages
-    categorias = []
-    for categoria, valor in sorted(category_totals.items(), key=lambda x: x[1], reverse=True):
-        percentual = (float(valor) / float(grand_total)) * 100
-        categorias.append(CategorySummary(
+    categorias = [
+        CategorySummary(
             categoria=categoria,
             valor_total=valor,
-            percentual=round(percentual, 2)
-        ))
+            percentual=round((float(valor) / divisor) * 100, 2)
+        )
+        for categoria, valor in category_totals
+    ]
     
-    return DashboardCategorySummary(
+    category_summary = DashboardCategorySummary(
         mes=mes,
         ano=ano,
-        total=grand_total if grand_total != Decimal('1') else Decimal('0'),
+        total=grand_total,
         categorias=categorias
     )
+    
+    set_dashboard_cache(current_user.id, cache_name, category_summary.model_dump(mode="json"))
+    return category_summary
 
 
 @router.get("/recent-transactions", response_model=List[dict])
-async def get_recent_transactions(
+def get_recent_transactions(
     limit: int = Query(5, ge=1, le=20),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -159,7 +198,22 @@ async def get_recent_transactions(
     """
     Get the most recent transactions for the dashboard.
     """
-    transactions = db.query(Transaction).filter(
+    # Pending installments are checked in SQL
+    has_pending = exists().where(
+        Installment.transacao_id == Transaction.id,
+        Installment.status_pagamento == PaymentStatus.PENDENTE
+    )
+    
+    # Only the columns the response needs - no ORM entities
+    transactions = db.query(
+        Transaction.id,
+        Transaction.descricao,
+        Transaction.categoria,
+        Transaction.tipo,
+        Transaction.valor_total,
+        Transaction.data_compra,
+        has_pending.label('has_pending')
+    ).filter(
         Transaction.user_id == current_user.id
     ).order_by(Transaction.data_compra.desc()).limit(limit).all()
     
@@ -169,8 +223,7 @@ async def get_recent_transactions(
         if t.tipo == TransactionType.ENTRADA:
             status = "RECEBIDO"
         elif t.tipo == TransactionType.SAIDA_CREDITO:
-            pending = any(i.status_pagamento == PaymentStatus.PENDENTE for i in t.installments)
-            status = "PENDENTE" if pending else "CONFIRMADO"
+            status = "PENDENTE" if t.has_pending else "CONFIRMADO"
         
         result.append({
             "id": t.id,
@@ -186,35 +239,54 @@ async def get_recent_transactions(
 
 
 @router.get("/savings-summary")
-async def get_savings_summary(
+def get_savings_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get summary of all savings goals.
     """
-    goals = db.query(SavingsGoal).filter(
+    cached = get_dashboard_cache(current_user.id, "savings")
+    if cached is not None:
+        return cached
+    
+    # Per-goal columns plus window totals in one query - no ORM hydration
+    goals = db.query(
+        SavingsGoal.id,
+        SavingsGoal.nome_objetivo,
+        SavingsGoal.valor_atual,
+        SavingsGoal.valor_meta,
+        SavingsGoal.progress_percentage.label('progress'),
+        SavingsGoal.data_limite,
+        func.sum(SavingsGoal.valor_atual).over().label('total_guardado'),
+        func.sum(SavingsGoal.valor_meta).over().label('total_metas')
+    ).filter(
         SavingsGoal.user_id == current_user.id,
         SavingsGoal.is_active == True
     ).all()
     
-    total_guardado = sum(float(g.valor_atual) for g in goals)
-    total_metas = sum(float(g.valor_meta) for g in goals)
+    # Totals are repeated on every row; no goals means nothing saved
+    total_guardado = float(goals[0].total_guardado) if goals else 0.0
+    total_metas = float(goals[0].total_metas) if goals else 0.0
     
-    goals_summary = []
-    for g in goals:
-        goals_summary.append({
+    goals_summary = [
+        {
             "id": g.id,
             "nome": g.nome_objetivo,
             "valor_atual": float(g.valor_atual),
             "valor_meta": float(g.valor_meta),
-            "progress": g.progress_percentage,
+            "progress": float(g.progress),
             "data_limite": g.data_limite.isoformat() if g.data_limite else None
-        })
+        }
+        for g in goals
+    ]
     
-    return {
+    savings_summary = {
         "total_guardado": total_guardado,
         "total_metas": total_metas,
         "progress_geral": (total_guardado / total_metas * 100) if total_metas > 0 else 0,
         "goals": goals_summary
     }
+    
+    set_dashboard_cache(current_user.id, "savings", savings_summary)
+    return savings_summary
@@ -12,16 +12,19 @@ Endpoints:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List
-from decimal import Decimal
 
+from ..cache import invalidate_dashboard_cache
 from ..database import get_db
 from ..models import SavingsGoal, User
 from ..schemas import (
     SavingsGoalCreate, SavingsGoalRead, SavingsGoalUpdate,
     SavingsGoalDeposit, SavingsGoalWithdraw
 )
+from ..utils import CENTAVO
 from .auth import get_current_user
 
 router = APIRouter()
@@ -32,7 +35,7 @@ router = APIRouter()
 # ============================================
 
 @router.get("/", response_model=List[SavingsGoalRead])
-async def list_savings_goals(
+def list_savings_goals(
     active_only: bool = True,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -42,7 +45,18 @@ async def list_savings_goals(
     
     - **active_only**: If true, only return active goals (default: true)
     """
-    query = db.query(SavingsGoal).filter(SavingsGoal.user_id == current_user.id)
+    # Load only the columns SavingsGoalRead consumes
+    query = db.query(SavingsGoal).options(load_only(
+        SavingsGoal.id,
+        SavingsGoal.user_id,
+        SavingsGoal.nome_objetivo,
+        SavingsGoal.descricao,
+        SavingsGoal.valor_meta,
+        SavingsGoal.valor_atual,
+        SavingsGoal.data_limite,
+        SavingsGoal.is_active,
+        SavingsGoal.created_at
+    )).filter(SavingsGoal.user_id == current_user.id)
     
     if active_only:
         query = query.filter(SavingsGoal.is_active == True)
@@ -52,7 +66,7 @@ async def list_savings_goals(
 
 
 @router.post("/", response_model=SavingsGoalRead, status_code=status.HTTP_201_CREATED)
-async def create_savings_goal(
+def create_savings_goal(
     goal_data: SavingsGoalCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -66,24 +80,26 @@ async def create_savings_goal(
     - **valor_inicial**: Initial deposit (optional, default: 0)
     - **data_limite**: Target date (optional)
     """
+    # Amounts are quantized like the Numeric(12, 2) columns: with no refresh
+    # after commit, the response is built from these instance values
     new_goal = SavingsGoal(
         user_id=current_user.id,
         nome_objetivo=goal_data.nome_objetivo,
         descricao=goal_data.descricao,
-        valor_meta=goal_data.valor_meta,
-        valor_atual=goal_data.valor_inicial,
+        valor_meta=goal_data.valor_meta.quantize(CENTAVO),
+        valor_atual=goal_data.valor_inicial.quantize(CENTAVO),
         data_limite=goal_data.data_limite
     )
     
     db.add(new_goal)
     db.commit()
-    db.refresh(new_goal)
+    invalidate_dashboard_cache(current_user.id)
     
     return new_goal
 
 
 @router.get("/{goal_id}", response_model=SavingsGoalRead)
-async def get_savings_goal(
+def get_savings_goal(
     goal_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -93,12 +109,9 @@ async def get_savings_goal(
     
     Returns the goal with progress_percentage and valor_restante calculated.
     """
-    goal = db.query(SavingsGoal).filter(
-        SavingsGoal.id == goal_id,
-        SavingsGoal.user_id == current_user.id
-    ).first()
+    goal = db.get(SavingsGoal, goal_id)
     
-    if not goal:
+    if not goal or goal.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Meta não encontrada"
@@ -108,7 +121,7 @@ async def get_savings_goal(
 
 
 @router.put("/{goal_id}", response_model=SavingsGoalRead)
-async def update_savings_goal(
+def update_savings_goal(
     goal_id: int,
     goal_data: SavingsGoalUpdate,
     current_user: User = Depends(get_current_user),
@@ -122,10 +135,19 @@ async def update_savings_goal(
     - **valor_meta**: Update target amount (optional)
     - **data_limite**: Update target date (optional)
     """
-    goal = db.query(SavingsGoal).filter(
-        SavingsGoal.id == goal_id,
-        SavingsGoal.user_id == current_user.id
-    ).first()
+    values = goal_data.model_dump(exclude_none=True)
+    
+    if values:
+        goal = db.execute(
+            update(SavingsGoal)
+            .where(SavingsGoal.id == goal_id, SavingsGoal.user_id == current_user.id)
+            .values(**values)
+            .returning(SavingsGoal)
+        ).scalar_one_or_none()
+    else:
+        goal = db.get(SavingsGoal, goal_id)
+        if goal and goal.user_id != current_user.id:
+            goal = None
     
     if not goal:
         raise HTTPException(
@@ -133,23 +155,15 @@ async def update_savings_goal(
             detail="Meta não encontrada"
         )
     
-    if goal_data.nome_objetivo is not None:
-        goal.nome_objetivo = goal_data.nome_objetivo
-    if goal_data.descricao is not None:
-        goal.descricao = goal_data.descricao
-    if goal_data.valor_meta is not None:
-        goal.valor_meta = goal_data.valor_meta
-    if goal_data.data_limite is not None:
-        goal.data_limite = goal_data.data_limite
-    
-    db.commit()
-    db.refresh(goal)
+    if values:
+        db.commit()
+        invalidate_dashboard_cache(current_user.id)
     
     return goal
 
 
 @router.delete("/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_savings_goal(
+def delete_savings_goal(
     goal_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -159,12 +173,9 @@ async def delete_savings_goal(
     
     Note: This permanently deletes the goal and its history.
     """
-    goal = db.query(SavingsGoal).filter(
-        SavingsGoal.id == goal_id,
-        SavingsGoal.user_id == current_user.id
-    ).first()
+    goal = db.get(SavingsGoal, goal_id)
     
-    if not goal:
+    if not goal or goal.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Meta não encontrada"
@@ -172,6 +183,7 @@ async def delete_savings_goal(
     
     db.delete(goal)
     db.commit()
+    invalidate_dashboard_cache(current_user.id)
 
 
 # ============================================
@@ -179,7 +191,7 @@ async def delete_savings_goal(
 # ============================================
 
 @router.post("/{goal_id}/deposit", response_model=SavingsGoalRead)
-async def deposit_to_goal(
+def deposit_to_goal(
     goal_id: int,
     deposit: SavingsGoalDeposit,
     current_user: User = Depends(get_current_user),
@@ -190,34 +202,43 @@ async def deposit_to_goal(
     
     - **valor**: Amount to deposit (must be positive)
     """
-    goal = db.query(SavingsGoal).filter(
-        SavingsGoal.id == goal_id,
-        SavingsGoal.user_id == current_user.id
-    ).first()
-    
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Meta não encontrada"
+    # Add deposit to current value in the database, so concurrent
+    # deposits can't overwrite each other. Rounded to cents because SQLite
+    # stores Numeric as REAL and float sums would drift.
+    goal = db.execute(
+        update(SavingsGoal)
+        .where(
+            SavingsGoal.id == goal_id,
+            SavingsGoal.user_id == current_user.id,
+            SavingsGoal.is_active == True
         )
+        .values(valor_atual=func.round(SavingsGoal.valor_atual + deposit.valor, 2))
+        .returning(SavingsGoal)
+    ).scalar_one_or_none()
     
-    if not goal.is_active:
+    if not goal:
+        # Tell a missing goal apart from an inactive one
+        existing = db.get(SavingsGoal, goal_id)
+        if not existing or existing.user_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Meta não encontrada"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Meta inativa não pode receber depósitos"
         )
     
-    # Add deposit to current value
-    goal.valor_atual = Decimal(str(goal.valor_atual)) + deposit.valor
-    
+    # Two-place Decimal in the response, like the column; not a pending change
+    set_committed_value(goal, "valor_atual", goal.valor_atual.quantize(CENTAVO))
     db.commit()
-    db.refresh(goal)
+    invalidate_dashboard_cache(current_user.id)
     
     return goal
 
 
 @router.post("/{goal_id}/withdraw", response_model=SavingsGoalRead)
-async def withdraw_from_goal(
+def withdraw_from_goal(
     goal_id: int,
     withdraw: SavingsGoalWithdraw,
     current_user: User = Depends(get_current_user),
@@ -228,36 +249,43 @@ async def withdraw_from_goal(
     
     - **valor**: Amount to withdraw (must be positive and <= current value)
     """
-    goal = db.query(SavingsGoal).filter(
-        SavingsGoal.id == goal_id,
-        SavingsGoal.user_id == current_user.id
-    ).first()
-    
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Meta não encontrada"
+    # Balance check and subtraction in one conditional UPDATE, so two
+    # concurrent withdrawals can't both pass the check. Both sides are
+    # rounded to cents: SQLite stores Numeric as REAL, so a balance of
+    # 0.80 may be held as 0.7999999999999999.
+    goal = db.execute(
+        update(SavingsGoal)
+        .where(
+            SavingsGoal.id == goal_id,
+            SavingsGoal.user_id == current_user.id,
+            func.round(SavingsGoal.valor_atual, 2) >= withdraw.valor
         )
+        .values(valor_atual=func.round(SavingsGoal.valor_atual - withdraw.valor, 2))
+        .returning(SavingsGoal)
+    ).scalar_one_or_none()
     
-    current_value = Decimal(str(goal.valor_atual))
-    
-    if withdraw.valor > current_value:
+    if not goal:
+        # Tell a missing goal apart from an insufficient balance
+        existing = db.get(SavingsGoal, goal_id)
+        if not existing or existing.user_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Meta não encontrada"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Saldo insuficiente. Disponível: R$ {current_value:.2f}"
+            detail=f"Saldo insuficiente. Disponível: R$ {existing.valor_atual:.2f}"
         )
     
-    # Subtract withdrawal from current value
-    goal.valor_atual = current_value - withdraw.valor
-    
+    set_committed_value(goal, "valor_atual", goal.valor_atual.quantize(CENTAVO))
     db.commit()
-    db.refresh(goal)
+    invalidate_dashboard_cache(current_user.id)
     
     return goal
 
 
 @router.post("/{goal_id}/complete", response_model=SavingsGoalRead)
-async def complete_goal(
+def complete_goal(
     goal_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -265,10 +293,12 @@ async def complete_goal(
     """
     Mark a savings goal as completed/inactive.
     """
-    goal = db.query(SavingsGoal).filter(
-        SavingsGoal.id == goal_id,
-        SavingsGoal.user_id == current_user.id
-    ).first()
+    goal = db.execute(
+        update(SavingsGoal)
+        .where(SavingsGoal.id == goal_id, SavingsGoal.user_id == current_user.id)
+        .values(is_active=False)
+        .returning(SavingsGoal)
+    ).scalar_one_or_none()
     
     if not goal:
         raise HTTPException(
@@ -276,8 +306,7 @@ async def complete_goal(
             detail="Meta não encontrada"
         )
     
-    goal.is_active = False
     db.commit()
-    db.refresh(goal)
+    invalidate_dashboard_cache(current_user.id)
     
     return goal
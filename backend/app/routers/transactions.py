@@ -4,27 +4,34 @@ Transactions Router for FinanceApp
 Endpoints:
 - GET / - List all transactions
 - POST / - Create new transaction (auto-generates installments for credit)
+- GET /categories - List categories used by the user
 - GET /{id} - Get transaction by ID
 - PUT /{id} - Update transaction
 - DELETE /{id} - Delete transaction
 - PUT /installments/{id} - Update installment status
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import case, desc, exists, insert, update
 from typing import List, Optional
 from datetime import date
 from decimal import Decimal
 
+from ..cache import (
+    invalidate_dashboard_cache,
+    get_cached_categories,
+    set_cached_categories,
+    invalidate_cached_categories
+)
 from ..database import get_db
 from ..models import Transaction, Installment, User, TransactionType, PaymentStatus
 from ..schemas import (
     TransactionCreate, TransactionRead, TransactionUpdate,
     TransactionListItem, InstallmentRead, InstallmentUpdate,
-    TransactionFilter, PaginatedResponse
+    TransactionFilter, PaginatedResponse, TransactionListAdapter
 )
-from ..utils import calcular_datas_parcelas
+from ..utils import CENTAVO, calcular_datas_parcelas, get_intervalo_mes
 from .auth import get_current_user
 
 router = APIRouter()
@@ -35,7 +42,7 @@ router = APIRouter()
 # ============================================
 
 @router.get("/", response_model=List[TransactionListItem])
-async def list_transactions(
+def list_transactions(
     tipo: Optional[TransactionType] = None,
     categoria: Optional[str] = None,
     data_inicio: Optional[date] = None,
@@ -53,7 +60,29 @@ async def list_transactions(
     - **data_inicio**: Filter from date
     - **data_fim**: Filter to date
     """
-    query = db.query(Transaction).filter(Transaction.user_id == current_user.id)
+    # Status is derived in SQL; credit purchases are pending while any
+    # of their installments is
+    has_pending = exists().where(
+        Installment.transacao_id == Transaction.id,
+        Installment.status_pagamento == PaymentStatus.PENDENTE
+    )
+    status_expr = case(
+        (Transaction.tipo == TransactionType.ENTRADA, "RECEBIDO"),
+        (Transaction.tipo == TransactionType.SAIDA_DEBITO, "CONFIRMADO"),
+        (has_pending, "PENDENTE"),
+        else_="CONFIRMADO"
+    )
+    
+    query = db.query(
+        Transaction.id,
+        Transaction.descricao,
+        Transaction.categoria,
+        Transaction.tipo,
+        Transaction.valor_total,
+        Transaction.data_compra,
+        Transaction.num_parcelas,
+        status_expr.label("status")
+    ).filter(Transaction.user_id == current_user.id)
     
     # Apply filters
     if tipo:
@@ -70,36 +99,17 @@ async def list_transactions(
         (page - 1) * page_size
     ).limit(page_size).all()
     
-    # Add status to each transaction
-    result = []
-    for t in transactions:
-        status = None
-        if t.tipo == TransactionType.ENTRADA:
-            status = "RECEBIDO"
-        elif t.tipo == TransactionType.SAIDA_DEBITO:
-            status = "CONFIRMADO"
-        elif t.tipo == TransactionType.SAIDA_CREDITO:
-            # Check if any installment is pending
-            pending = any(i.status_pagamento == PaymentStatus.PENDENTE for i in t.installments)
-            status = "PENDENTE" if pending else "CONFIRMADO"
-        
-        item = TransactionListItem(
-            id=t.id,
-            descricao=t.descricao,
-            categoria=t.categoria,
-            tipo=t.tipo,
-            valor_total=t.valor_total,
-            data_compra=t.data_compra,
-            num_parcelas=t.num_parcelas,
-            status=status
-        )
-        result.append(item)
-    
-    return result
+    # Validate and serialize the page in one pass; returning a Response
+    # skips FastAPI's per-item re-validation of response_model
+    items = TransactionListAdapter.validate_python([dict(row._mapping) for row in transactions])
+    return Response(
+        content=TransactionListAdapter.dump_json(items),
+        media_type="application/json"
+    )
 
 
 @router.post("/", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
-async def create_transaction(
+def create_transaction(
     transaction_data: TransactionCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -119,9 +129,11 @@ async def create_transaction(
     - **notas**: Additional notes (optional)
     """
     # Create transaction
+    # Quantized like the Numeric(12, 2) column, since the response is built
+    # from the instance without a refresh
     new_transaction = Transaction(
         user_id=current_user.id,
-        valor_total=transaction_data.valor_total,
+        valor_total=transaction_data.valor_total.quantize(CENTAVO),
         descricao=transaction_data.descricao,
         categoria=transaction_data.categoria,
         tipo=transaction_data.tipo,
@@ -141,25 +153,51 @@ async def create_transaction(
             valor_total=Decimal(str(transaction_data.valor_total))
         )
         
-        for parcela in parcelas:
-            installment = Installment(
-                transacao_id=new_transaction.id,
-                numero_parcela=parcela["numero_parcela"],
-                total_parcelas=parcela["total_parcelas"],
-                valor_parcela=parcela["valor_parcela"],
-                data_vencimento=parcela["data_vencimento"],
-                status_pagamento=PaymentStatus.PENDENTE
-            )
-            db.add(installment)
+        # Single multi-row INSERT instead of one ORM object per installment
+        db.execute(insert(Installment), [
+            {
+                "transacao_id": new_transaction.id,
+                "numero_parcela": parcela["numero_parcela"],
+                "total_parcelas": parcela["total_parcelas"],
+                "valor_parcela": parcela["valor_parcela"],
+                "data_vencimento": parcela["data_vencimento"],
+                "status_pagamento": PaymentStatus.PENDENTE
+            }
+            for parcela in parcelas
+        ])
     
     db.commit()
-    db.refresh(new_transaction)
+    invalidate_dashboard_cache(current_user.id)
+    invalidate_cached_categories(current_user.id)
     
     return new_transaction
 
 
+# Registered before /{transaction_id} so "categories" isn't parsed as an ID
+@router.get("/categories", response_model=List[str])
+def get_categories(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get list of categories used by the current user.
+    """
+    cached = get_cached_categories(current_user.id)
+    if cached is not None:
+        return cached
+    
+    categories = db.query(Transaction.categoria).filter(
+        Transaction.user_id == current_user.id
+    ).distinct().all()
+    
+    result = [c[0] for c in categories]
+    set_cached_categories(current_user.id, result)
+    
+    return result
+
+
 @router.get("/{transaction_id}", response_model=TransactionRead)
-async def get_transaction(
+def get_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -167,12 +205,14 @@ async def get_transaction(
     """
     Get a specific transaction by ID with all installments.
     """
-    transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
-    ).first()
+    # Installments are loaded up front; any other lazy load is a bug
+    transaction = db.get(
+        Transaction,
+        transaction_id,
+        options=[selectinload(Transaction.installments), raiseload("*")]
+    )
     
-    if not transaction:
+    if not transaction or transaction.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transação não encontrada"
@@ -182,7 +222,7 @@ async def get_transaction(
 
 
 @router.put("/{transaction_id}", response_model=TransactionRead)
-async def update_transaction(
+def update_transaction(
     transaction_id: int,
     transaction_data: TransactionUpdate,
     current_user: User = Depends(get_current_user),
@@ -193,10 +233,20 @@ async def update_transaction(
     
     Note: valor_total, tipo, and num_parcelas cannot be changed after creation.
     """
-    transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
-    ).first()
+    values = transaction_data.model_dump(exclude_none=True)
+    
+    if values:
+        # Single UPDATE ... RETURNING; the ownership check is part of the WHERE
+        transaction = db.execute(
+            update(Transaction)
+            .where(Transaction.id == transaction_id, Transaction.user_id == current_user.id)
+            .values(**values)
+            .returning(Transaction)
+        ).scalar_one_or_none()
+    else:
+        transaction = db.get(Transaction, transaction_id)
+        if transaction and transaction.user_id != current_user.id:
+            transaction = None
     
     if not transaction:
         raise HTTPException(
@@ -204,21 +254,16 @@ async def update_transaction(
             detail="Transação não encontrada"
         )
     
-    if transaction_data.descricao is not None:
-        transaction.descricao = transaction_data.descricao
-    if transaction_data.categoria is not None:
-        transaction.categoria = transaction_data.categoria
-    if transaction_data.notas is not None:
-        transaction.notas = transaction_data.notas
-    
-    db.commit()
-    db.refresh(transaction)
+    if values:
+        db.commit()
+        invalidate_dashboard_cache(current_user.id)
+        invalidate_cached_categories(current_user.id)
     
     return transaction
 
 
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_transaction(
+def delete_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -226,12 +271,9 @@ async def delete_transaction(
     """
     Delete a transaction and all its installments.
     """
-    transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
-    ).first()
+    transaction = db.get(Transaction, transaction_id)
     
-    if not transaction:
+    if not transaction or transaction.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transação não encontrada"
@@ -239,6 +281,8 @@ async def delete_transaction(
     
     db.delete(transaction)
     db.commit()
+    invalidate_dashboard_cache(current_user.id)
+    invalidate_cached_categories(current_user.id)
 
 
 # ============================================
@@ -246,7 +290,7 @@ async def delete_transaction(
 # ============================================
 
 @router.get("/installments/month", response_model=List[InstallmentRead])
-async def get_installments_by_month(
+def get_installments_by_month(
     mes: int = Query(..., ge=1, le=12),
     ano: int = Query(..., ge=2000),
     current_user: User = Depends(get_current_user),
@@ -255,19 +299,19 @@ async def get_installments_by_month(
     """
     Get all installments due in a specific month.
     """
-    from sqlalchemy import extract
+    inicio, fim = get_intervalo_mes(mes, ano)
     
     installments = db.query(Installment).join(Transaction).filter(
         Transaction.user_id == current_user.id,
-        extract('month', Installment.data_vencimento) == mes,
-        extract('year', Installment.data_vencimento) == ano
-    ).order_by(Installment.data_vencimento).all()
+        Installment.data_vencimento >= inicio,
+        Installment.data_vencimento < fim
+    ).options(raiseload("*")).order_by(Installment.data_vencimento).all()
     
     return installments
 
 
 @router.put("/installments/{installment_id}", response_model=InstallmentRead)
-async def update_installment_status(
+def update_installment_status(
     installment_id: int,
     status_data: InstallmentUpdate,
     current_user: User = Depends(get_current_user),
@@ -278,10 +322,16 @@ async def update_installment_status(
     
     - **status_pagamento**: pendente, pago, or atrasado
     """
-    installment = db.query(Installment).join(Transaction).filter(
-        Installment.id == installment_id,
+    owned = exists().where(
+        Transaction.id == Installment.transacao_id,
         Transaction.user_id == current_user.id
-    ).first()
+    )
+    installment = db.execute(
+        update(Installment)
+        .where(Installment.id == installment_id, owned)
+        .values(status_pagamento=status_data.status_pagamento)
+        .returning(Installment)
+    ).scalar_one_or_none()
     
     if not installment:
         raise HTTPException(
@@ -289,23 +339,7 @@ async def update_installment_status(
             detail="Parcela não encontrada"
         )
     
-    installment.status_pagamento = status_data.status_pagamento
     db.commit()
-    db.refresh(installment)
+    invalidate_dashboard_cache(current_user.id)
     
     return installment
-
-
-@router.get("/categories", response_model=List[str])
-async def get_categories(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """
-    Get list of categories used by the current user.
-    """
-    categories = db.query(Transaction.categoria).filter(
-        Transaction.user_id == current_user.id
-    ).distinct().all()
-    
-    return [c[0] for c in categories]
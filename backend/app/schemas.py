@@ -10,7 +10,7 @@ Schemas organized by module:
 - Dashboard: Summary views
 """
 
-from pydantic import BaseModel, EmailStr, Field, field_validator, computed_field
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, field_validator
 from typing import Optional, List
 from datetime import date, datetime
 from decimal import Decimal
@@ -87,6 +87,7 @@ class Token(BaseModel):
     """JWT Token response schema."""
     access_token: str
     token_type: str = "bearer"
+    user: Optional[UserRead] = None  # Saves clients a follow-up /auth/me call
 
 
 class TokenData(BaseModel):
@@ -118,12 +119,7 @@ class InstallmentRead(InstallmentBase):
     id: int
     transacao_id: int
     created_at: datetime
-
-    @computed_field
-    @property
-    def parcela_formatada(self) -> str:
-        """Returns formatted installment string like '1/12'."""
-        return f"{self.numero_parcela}/{self.total_parcelas}"
+    parcela_formatada: str  # Read from Installment.parcela_formatada, e.g. '1/12'
 
     model_config = {"from_attributes": True}
 
@@ -260,22 +256,9 @@ class SavingsGoalRead(SavingsGoalBase):
     valor_atual: Decimal
     is_active: bool
     created_at: datetime
-
-    @computed_field
-    @property
-    def progress_percentage(self) -> float:
-        """Calculate progress towards the goal (0-100)."""
-        if self.valor_meta and self.valor_meta > 0:
-            progress = (float(self.valor_atual) / float(self.valor_meta)) * 100
-            return round(min(progress, 100.0), 2)
-        return 0.0
-
-    @computed_field
-    @property
-    def valor_restante(self) -> Decimal:
-        """Calculate remaining amount to reach goal."""
-        remaining = self.valor_meta - self.valor_atual
-        return max(remaining, Decimal("0"))
+    # Read from the SavingsGoal hybrid properties
+    progress_percentage: float  # 0-100
+    valor_restante: Decimal
 
     model_config = {"from_attributes": True}
 
@@ -328,15 +311,9 @@ class DashboardSummary(BaseModel):
     total_saidas: Decimal = Field(..., description="Total de despesas do mês")
     total_guardado: Decimal = Field(..., description="Total em cofrinhos")
     saldo_disponivel: Decimal = Field(..., description="Saldo disponível")
-
-    @computed_field
-    @property
-    def variacao_percentual(self) -> Optional[float]:
-        """Calculate percentage variation (income vs expenses)."""
-        if self.total_entradas > 0:
-            savings_rate = ((self.total_entradas - self.total_saidas) / self.total_entradas) * 100
-            return round(float(savings_rate), 2)
-        return None
+    variacao_percentual: Optional[float] = Field(
+        None, description="Percentual da receita que sobrou no mês"
+    )
 
 
 class CategorySummary(BaseModel):
@@ -389,3 +366,12 @@ class PaginatedResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+
+
+# ============================================
+# TYPE ADAPTERS
+# ============================================
+
+# Built once at import and reused by list_transactions to validate and
+# serialize a whole page in a single call
+TransactionListAdapter = TypeAdapter(List[TransactionListItem])
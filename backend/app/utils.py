@@ -7,18 +7,23 @@ Includes:
 - JWT token generation
 """
 
+from calendar import monthrange
 from datetime import date, datetime, timedelta
-from dateutil.relativedelta import relativedelta
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import List, Dict, Any
 import bcrypt
 from jose import JWTError, jwt
 import os
+import time
 
 # ============================================
 # PASSWORD HASHING
 # ============================================
 
+# Bcrypt work factor - each +1 doubles hashing time
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
 
 def hash_password(password: str) -> str:
     """
@@ -30,7 +35,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -96,17 +101,33 @@ def decode_access_token(token: str) -> dict:
     Returns:
         Decoded token payload
         
+    Verified payloads are cached per token, so repeated requests with the
+    same token skip the signature check; expiry is still enforced on
+    every call. The returned dict is shared and must not be modified.
+    
     Raises:
         JWTError: If token is invalid or expired
     """
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    payload = _decode_access_token_cached(token)
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise JWTError("Signature has expired.")
     return payload
 
 
+@lru_cache(maxsize=1024)
+def _decode_access_token_cached(token: str) -> dict:
+    """Verify a token once; invalid tokens raise and are never cached."""
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
 # ============================================
 # INSTALLMENT CALCULATION
 # ============================================
 
+CENTAVO = Decimal("0.01")  # Quantum for monetary rounding
+
+
 def calcular_datas_parcelas(
     data_primeira_parcela: date,
     num_parcelas: int,
@@ -160,7 +181,7 @@ def calcular_datas_parcelas(
     
     # Calculate base installment value (rounded to 2 decimal places)
     valor_parcela_base = (valor_total / num_parcelas).quantize(
-        Decimal("0.01"),
+        CENTAVO,
         rounding=ROUND_HALF_UP
     )
     
@@ -168,27 +189,32 @@ def calcular_datas_parcelas(
     valor_total_calculado = valor_parcela_base * num_parcelas
     diferenca = valor_total - valor_total_calculado
     
+    # Due dates use plain month arithmetic (months since year 0) instead of
+    # relativedelta; days past a month's end are clamped, e.g. Jan 31 -> Feb 28
+    base_mes = data_primeira_parcela.year * 12 + data_primeira_parcela.month - 1
+    dia = data_primeira_parcela.day
+    ultima = num_parcelas - 1
+    
     parcelas = []
     
     for i in range(num_parcelas):
-        # Calculate due date (add i months to the first date)
-        data_vencimento = data_primeira_parcela + relativedelta(months=i)
+        ano, mes = divmod(base_mes + i, 12)
+        mes += 1
+        dia_vencimento = dia if dia <= 28 else min(dia, monthrange(ano, mes)[1])
         
         # Adjust the last installment value if there's a rounding difference
-        if i == num_parcelas - 1 and diferenca != 0:
+        if i == ultima and diferenca != 0:
             valor_parcela = valor_parcela_base + diferenca
         else:
             valor_parcela = valor_parcela_base
         
-        parcela = {
+        parcelas.append({
             "numero_parcela": i + 1,
             "total_parcelas": num_parcelas,
             "valor_parcela": valor_parcela,
-            "data_vencimento": data_vencimento,
+            "data_vencimento": date(ano, mes, dia_vencimento),
             "status_pagamento": "pendente"
-        }
-        
-        parcelas.append(parcela)
+        })
     
     return parcelas
 
@@ -219,6 +245,10 @@ def get_parcelas_do_mes(
 # DATE UTILITIES
 # ============================================
 
+# Days in each month of a non-leap year
+_DIAS_NO_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def get_primeiro_dia_mes(mes: int, ano: int) -> date:
     """Get the first day of a month."""
     return date(ano, mes, 1)
@@ -226,9 +256,23 @@ def get_primeiro_dia_mes(mes: int, ano: int) -> date:
 
 def get_ultimo_dia_mes(mes: int, ano: int) -> date:
     """Get the last day of a month."""
+    dia = _DIAS_NO_MES[mes - 1]
+    if mes == 2 and ano % 4 == 0 and (ano % 100 != 0 or ano % 400 == 0):
+        dia = 29
+    return date(ano, mes, dia)
+
+
+def get_intervalo_mes(mes: int, ano: int) -> tuple:
+    """
+    Get the half-open date range [inicio, fim) covering a month.
+    
+    Filtering with `col >= inicio AND col < fim` keeps the predicate
+    sargable, so indexes on date columns can be used.
+    """
+    inicio = date(ano, mes, 1)
     if mes == 12:
-        return date(ano + 1, 1, 1) - timedelta(days=1)
-    return date(ano, mes + 1, 1) - timedelta(days=1)
+        return inicio, date(ano + 1, 1, 1)
+    return inicio, date(ano, mes + 1, 1)
 
 
 def get_mes_anterior(mes: int, ano: int) -> tuple:
@@ -242,6 +286,13 @@ def get_mes_anterior(mes: int, ano: int) -> tuple:
 # FORMATTING UTILITIES
 # ============================================
 
+# Swaps the US separators produced by format() for Brazilian ones
+_BRL_FORMAT_TABLE = str.maketrans({",": ".", ".": ","})
+# Drops the currency symbol, spaces and thousands separators and turns the
+# decimal comma into a point
+_BRL_PARSE_TABLE = str.maketrans({"R": None, "$": None, " ": None, ".": None, ",": "."})
+
+
 def format_currency_brl(valor: Decimal) -> str:
     """
     Format a decimal value as Brazilian Real currency.
@@ -252,10 +303,7 @@ def format_currency_brl(valor: Decimal) -> str:
     Returns:
         Formatted string like "R$ 1.234,56"
     """
-    valor_str = f"{valor:,.2f}"
-    # Convert to Brazilian format
-    valor_str = valor_str.replace(",", "X").replace(".", ",").replace("X", ".")
-    return f"R$ {valor_str}"
+    return f"R$ {valor:,.2f}".translate(_BRL_FORMAT_TABLE)
 
 
 def parse_currency_brl(valor_str: str) -> Decimal:
@@ -268,8 +316,5 @@ def parse_currency_brl(valor_str: str) -> Decimal:
     Returns:
         Decimal value
     """
-    # Remove currency symbol and spaces
-    valor_str = valor_str.replace("R$", "").replace(" ", "").strip()
-    # Convert from Brazilian format
-    valor_str = valor_str.replace(".", "").replace(",", ".")
-    return Decimal(valor_str)
+    # Decimal() itself ignores any remaining surrounding whitespace
+    return Decimal(valor_str.translate(_BRL_PARSE_TABLE))
@@ -0,0 +1,68 @@
+"""
+Savings goal endpoint tests for FinanceApp.
+Runs the API against a throwaway SQLite file, where Numeric columns are
+stored as REAL.
+
+Usage (from the backend directory):
+    pytest tests
+"""
+
+import os
+import tempfile
+
+# Configure the app before it is imported
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ.pop("REDIS_URL", None)
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    Base.metadata.create_all(bind=engine)
+    yield TestClient(app)
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="module")
+def auth_headers(client):
+    client.post("/api/auth/register", json={
+        "nome": "Teste",
+        "email": "cofrinho@teste.com",
+        "senha": "123456",
+        "confirmar_senha": "123456"
+    })
+    response = client.post(
+        "/api/auth/login",
+        data={"username": "cofrinho@teste.com", "password": "123456"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_withdraw_full_balance_after_repeated_deposits(client, auth_headers):
+    """Eight deposits of 0.10 must allow withdrawing exactly 0.80."""
+    response = client.post("/api/savings/", headers=auth_headers, json={
+        "nome_objetivo": "Reserva",
+        "valor_meta": "100.00"
+    })
+    assert response.status_code == 201
+    goal_id = response.json()["id"]
+
+    for _ in range(8):
+        response = client.post(
+            f"/api/savings/{goal_id}/deposit", headers=auth_headers, json={"valor": "0.10"}
+        )
+        assert response.status_code == 200
+    assert response.json()["valor_atual"] == "0.80"
+
+    response = client.post(
+        f"/api/savings/{goal_id}/withdraw", headers=auth_headers, json={"valor": "0.80"}
+    )
+    assert response.status_code == 200
+    assert response.json()["valor_atual"] == "0.00"
@@ -3,66 +3,163 @@ FinanceApp Frontend - Flask + HTMX + Tailwind
 Mobile-first personal finance management app.
 """
 
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
-from functools import wraps
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, g
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, wraps
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import logging
+import orjson
 import os
 import sys
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
 app.secret_key = os.getenv("FLASK_SECRET_KEY", "dev-secret-key-change-in-production")
 
 # Backend API URL
 API_URL = os.getenv("API_URL", "http://localhost:8000/api")
 print(f"[STARTUP] API_URL = {API_URL}", file=sys.stderr, flush=True)
 
+# Shared HTTP session so backend calls reuse keep-alive connections
+# instead of opening a new socket per request
+http_session = requests.Session()
+# Retry a failed connect once right away; never retry reads, which may not be idempotent
+_retries = Retry(total=1, connect=1, read=0, backoff_factor=0)
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_retries)
+http_session.mount("http://", _adapter)
+http_session.mount("https://", _adapter)
+
+# After a connection failure, calls fail fast until this monotonic time
+# instead of each waiting for its own timeout
+BACKEND_DOWN_COOLDOWN = 2.0  # Seconds
+_backend_down_until = 0.0
+
+# Worker threads for independent backend calls made by a single page
+api_executor = ThreadPoolExecutor(max_workers=8)
+
+# Days in each month of a non-leap year
+_DIAS_NO_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 
 # ============================================
 # HELPERS
 # ============================================
 
 def get_auth_headers():
-    """Get authorization headers with JWT token."""
-    token = session.get("access_token")
-    if token:
-        return {"Authorization": f"Bearer {token}"}
-    return {}
-
-
-def api_request(method, endpoint, data=None, params=None):
-    """Make authenticated request to the backend API."""
+    """
+    Get authorization headers with JWT token.
+    
+    Built once per request and kept in flask.g; callers must not mutate it.
+    """
+    headers = g.get("auth_headers")
+    if headers is None:
+        token = session.get("access_token")
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        g.auth_headers = headers
+    return headers
+
+
+def api_request(method, endpoint, data=None, params=None, headers=None):
+    """
+    Make authenticated request to the backend API.
+    
+    Pass headers explicitly when calling outside the request context
+    (e.g. from a worker thread); otherwise they come from the session.
+    """
     url = f"{API_URL}{endpoint}"
-    headers = get_auth_headers()
-    headers["Content-Type"] = "application/json"
+    if headers is None:
+        headers = get_auth_headers()
+    
+    global _backend_down_until
+    if time.monotonic() < _backend_down_until:
+        logger.debug("API %s %s skipped: backend marked down", method, url)
+        return None
+    
+    logger.debug("API %s %s token=%s", method, url, "Authorization" in headers)
     
-    # Debug: print token status
-    print(f"[DEBUG] API Request to {url}", file=sys.stderr, flush=True)
-    print(f"[DEBUG] Token in session: {'Yes' if session.get('access_token') else 'No'}", file=sys.stderr, flush=True)
+    # Only requests with a body need a Content-Type; the body is pre-encoded with orjson
+    body = None
+    if data is not None:
+        body = orjson.dumps(data)
+        headers = {**headers, "Content-Type": "application/json"}
     
     try:
-        response = requests.request(
+        response = http_session.request(
             method=method,
             url=url,
-            json=data,
+            data=body,
             params=params,
             headers=headers,
             timeout=10
         )
-        print(f"[DEBUG] Response status: {response.status_code}", file=sys.stderr, flush=True)
+        logger.debug("API %s %s -> %s", method, url, response.status_code)
         return response
     except requests.RequestException as e:
-        print(f"[DEBUG] Request error: {e}", file=sys.stderr, flush=True)
+        logger.warning("API %s %s failed: %s", method, url, e)
+        if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+            _backend_down_until = time.monotonic() + BACKEND_DOWN_COOLDOWN
         return None
 
 
+def api_json(response):
+    """Decode a backend response body with orjson."""
+    return orjson.loads(response.content)
+
+
+def api_error_detail(response, default):
+    """Get the backend's error message ("detail") from a response, or default."""
+    try:
+        detail = api_json(response).get("detail")
+    except (ValueError, AttributeError):
+        return default
+    # Validation errors carry a list of problems; only plain messages are shown
+    return detail if isinstance(detail, str) else default
+
+
+def api_get_many(calls):
+    """
+    Run independent GET requests to the backend in parallel.
+    
+    Args:
+        calls: Dict mapping a name to an (endpoint, params) tuple
+    
+    Returns:
+        Dict mapping each name to its response (or None on error)
+    """
+    # Flask's session is only reachable from the request thread
+    headers = get_auth_headers()
+    futures = {
+        name: api_executor.submit(api_request, "GET", endpoint, None, params, headers)
+        for name, (endpoint, params) in calls.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def dias_no_mes(mes, ano):
+    """Number of days in a month (Gregorian leap years)."""
+    if mes == 2 and ano % 4 == 0 and (ano % 100 != 0 or ano % 400 == 0):
+        return 29
+    return _DIAS_NO_MES[mes - 1]
+
+
+@lru_cache(maxsize=256)
+def limites_mes_iso(mes, ano):
+    """First and last day of a month as ISO strings, e.g. ('2024-02-01', '2024-02-29')."""
+    return f"{ano:04d}-{mes:02d}-01", f"{ano:04d}-{mes:02d}-{dias_no_mes(mes, ano):02d}"
+
+
 def login_required(f):
     """Decorator to require login for routes."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if "access_token" not in session:
+        if session.get("access_token") is None:
             flash("Por favor, faça login para continuar.", "warning")
             return redirect(url_for("login"))
         return f(*args, **kwargs)
@@ -89,28 +186,18 @@ def login():
         senha = request.form.get("senha")
         
         # OAuth2 expects form-urlencoded with username/password
-        response = requests.post(
+        response = http_session.post(
             f"{API_URL}/auth/login",
             data={"username": email, "password": senha},
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=10
         )
         
         if response.status_code == 200:
-            data = response.json()
-            token = data["access_token"]
-            session["access_token"] = token
-            
-            # Get user info using the token directly
-            user_response = requests.get(
-                f"{API_URL}/auth/me",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                timeout=10
-            )
-            if user_response.status_code == 200:
-                session["user"] = user_response.json()
+            data = api_json(response)
+            session["access_token"] = data["access_token"]
+            # The login response already carries the user's profile
+            session["user"] = data["user"]
             
             flash("Login realizado com sucesso!", "success")
             return redirect(url_for("dashboard"))
@@ -132,21 +219,17 @@ def register():
             "confirmar_senha": request.form.get("confirmar_senha")
         }
         
-        response = requests.post(
+        response = http_session.post(
             f"{API_URL}/auth/register",
             json=data,
-            headers={"Content-Type": "application/json"}
+            timeout=10
         )
         
         if response.status_code == 201:
             flash("Conta criada com sucesso! Faça login.", "success")
             return redirect(url_for("login"))
         else:
-            try:
-                error_data = response.json()
-                error = error_data.get("detail", "Erro ao criar conta")
-            except Exception:
-                error = f"Erro ao criar conta (status {response.status_code})"
+            error = api_error_detail(response, f"Erro ao criar conta (status {response.status_code})")
             flash(error, "error")
     
     return render_template("auth/register.html")
@@ -168,26 +251,29 @@ def logout():
 @login_required
 def dashboard():
     """Main dashboard page."""
-    from datetime import datetime
-    
     mes = request.args.get("mes", datetime.now().month, type=int)
     ano = request.args.get("ano", datetime.now().year, type=int)
     
-    # Get dashboard summary
-    summary_response = api_request("GET", "/dashboard/summary", params={"mes": mes, "ano": ano})
-    summary = summary_response.json() if summary_response and summary_response.status_code == 200 else {}
+    # Summary, category breakdown, recent transactions and savings are
+    # independent, so fetch them in parallel
+    responses = api_get_many({
+        "summary": ("/dashboard/summary", {"mes": mes, "ano": ano}),
+        "categories": ("/dashboard/categories", {"mes": mes, "ano": ano}),
+        "recent": ("/dashboard/recent-transactions", {"limit": 5}),
+        "savings": ("/dashboard/savings-summary", None)
+    })
+    
+    summary_response = responses["summary"]
+    summary = api_json(summary_response) if summary_response and summary_response.status_code == 200 else {}
     
-    # Get expenses by category
-    categories_response = api_request("GET", "/dashboard/categories", params={"mes": mes, "ano": ano})
-    categories = categories_response.json() if categories_response and categories_response.status_code == 200 else {}
+    categories_response = responses["categories"]
+    categories = api_json(categories_response) if categories_response and categories_response.status_code == 200 else {}
     
-    # Get recent transactions
-    recent_response = api_request("GET", "/dashboard/recent-transactions", params={"limit": 5})
-    recent_transactions = recent_response.json() if recent_response and recent_response.status_code == 200 else []
+    recent_response = responses["recent"]
+    recent_transactions = api_json(recent_response) if recent_response and recent_response.status_code == 200 else []
     
-    # Get savings summary
-    savings_response = api_request("GET", "/dashboard/savings-summary")
-    savings = savings_response.json() if savings_response and savings_response.status_code == 200 else {}
+    savings_response = responses["savings"]
+    savings = api_json(savings_response) if savings_response and savings_response.status_code == 200 else {}
     
     return render_template(
         "dashboard/index.html",
@@ -219,11 +305,11 @@ def transactions():
         params["categoria"] = categoria
     
     response = api_request("GET", "/transactions/", params=params)
-    transactions_list = response.json() if response and response.status_code == 200 else []
+    transactions_list = api_json(response) if response and response.status_code == 200 else []
     
-    # Get categories for filter
+    # Get categories for filter (cached per user by the backend)
     cat_response = api_request("GET", "/transactions/categories")
-    categories = cat_response.json() if cat_response and cat_response.status_code == 200 else []
+    categories = api_json(cat_response) if cat_response and cat_response.status_code == 200 else []
     
     return render_template(
         "transactions/list.html",
@@ -261,7 +347,7 @@ def new_transaction():
             
             return redirect(url_for("transactions"))
         else:
-            error = response.json().get("detail", "Erro ao criar transação") if response else "Erro de conexão"
+            error = api_error_detail(response, "Erro ao criar transação") if response is not None else "Erro de conexão"
             flash(error, "error")
     
     return render_template("transactions/form.html", user=session.get("user", {}))
@@ -293,7 +379,7 @@ def delete_transaction(id):
 def savings():
     """Savings goals list page."""
     response = api_request("GET", "/savings/")
-    goals = response.json() if response and response.status_code == 200 else []
+    goals = api_json(response) if response and response.status_code == 200 else []
     
     return render_template(
         "savings/list.html",
@@ -341,7 +427,7 @@ def deposit_savings(id):
     
     if request.headers.get("HX-Request"):
         # Return updated goal card
-        goal = response.json() if response else {}
+        goal = api_json(response) if response else {}
         return render_template("savings/_goal_card.html", goal=goal)
     
     return redirect(url_for("savings"))
@@ -358,7 +444,7 @@ def withdraw_savings(id):
     if response and response.status_code == 200:
         flash(f"R$ {valor:.2f} resgatado com sucesso!", "success")
     else:
-        error = response.json().get("detail", "Erro ao resgatar") if response else "Erro"
+        error = api_error_detail(response, "Erro ao resgatar") if response is not None else "Erro"
         flash(error, "error")
     
     return redirect(url_for("savings"))
@@ -372,34 +458,32 @@ def withdraw_savings(id):
 @login_required
 def monthly_report():
     """Monthly financial report page."""
-    from datetime import datetime, date
-    import calendar
-    
     mes = request.args.get("mes", datetime.now().month, type=int)
     ano = request.args.get("ano", datetime.now().year, type=int)
     
-    # Get summary cards
-    summary_response = api_request("GET", "/dashboard/summary", params={"mes": mes, "ano": ano})
-    summary = summary_response.json() if summary_response and summary_response.status_code == 200 else {}
-    
-    # Get categories breakdown
-    categories_response = api_request("GET", "/dashboard/categories", params={"mes": mes, "ano": ano})
-    categories = categories_response.json() if categories_response and categories_response.status_code == 200 else {}
-    
-    # Get transactions for the month
     # Calculate start and end date of the month
-    last_day = calendar.monthrange(ano, mes)[1]
-    data_inicio = date(ano, mes, 1).isoformat()
-    data_fim = date(ano, mes, last_day).isoformat()
-    
-    # We need a transactions endpoint that supports date filtering
-    # The current transactions list endpoint supports filters, let's use it
-    transactions_response = api_request("GET", "/transactions/", params={
-        "data_inicio": data_inicio,
-        "data_fim": data_fim,
-        "page_size": 100 
+    data_inicio, data_fim = limites_mes_iso(mes, ano)
+    
+    # Summary cards, categories breakdown and the month's transactions
+    # (via the date filters of the list endpoint) are fetched in parallel
+    responses = api_get_many({
+        "summary": ("/dashboard/summary", {"mes": mes, "ano": ano}),
+        "categories": ("/dashboard/categories", {"mes": mes, "ano": ano}),
+        "transactions": ("/transactions/", {
+            "data_inicio": data_inicio,
+            "data_fim": data_fim,
+            "page_size": 100
+        })
     })
-    transactions = transactions_response.json() if transactions_response and transactions_response.status_code == 200 else []
+    
+    summary_response = responses["summary"]
+    summary = api_json(summary_response) if summary_response and summary_response.status_code == 200 else {}
+    
+    categories_response = responses["categories"]
+    categories = api_json(categories_response) if categories_response and categories_response.status_code == 200 else {}
+    
+    transactions_response = responses["transactions"]
+    transactions = api_json(transactions_response) if transactions_response and transactions_response.status_code == 200 else []
     
     return render_template(
         "reports/monthly.html",
@@ -420,13 +504,11 @@ def monthly_report():
 @login_required
 def partial_dashboard_summary():
     """HTMX partial for dashboard summary."""
-    from datetime import datetime
-    
     mes = request.args.get("mes", datetime.now().month, type=int)
     ano = request.args.get("ano", datetime.now().year, type=int)
     
     response = api_request("GET", "/dashboard/summary", params={"mes": mes, "ano": ano})
-    summary = response.json() if response and response.status_code == 200 else {}
+    summary = api_json(response) if response and response.status_code == 200 else {}
     
     return render_template("dashboard/_summary.html", summary=summary)
 